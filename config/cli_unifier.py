@@ -4,10 +4,12 @@ CLI commands.
 
 import platform
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
+@lru_cache(maxsize=1)
 def choose_python_exe() -> Path:
     """
     Select python binary path depending on current OS.
@@ -1,10 +1,10 @@
 """
 Settings manager.
 """
-import json
 # pylint: disable=no-name-in-module
 from pathlib import Path
 
+import orjson
 from pydantic.dataclasses import dataclass
 from pydantic.tools import parse_obj_as
 
@@ -55,9 +55,8 @@ class LabSettings:
             config_path (Path): Path to configuration
         """
         super().__init__()
-        with config_path.open(encoding='utf-8') as config_file:
-            # pylint: disable=no-member
-            self._dto = parse_obj_as(LabSettingsModel, json.load(config_file))
+        # pylint: disable=no-member
+        self._dto = parse_obj_as(LabSettingsModel, orjson.loads(config_path.read_bytes()))
 
     @property
     def target_score(self) -> int:
@@ -10,21 +10,17 @@ configure_script
 
 FAILED=0
 
-lint_output=$(python -m pylint --exit-zero config seminars admin_utils)
-
-python config/stage_1_style_tests/lint_level.py \
-  --lint-output "${lint_output}" \
-  --target-score "10"
+python -m pylint --exit-zero config seminars admin_utils | \
+  python config/stage_1_style_tests/lint_level.py \
+    --target-score "10"
 
 check_if_failed
 
 if [ -d "core_utils" ]; then
   echo "core_utils exist"
-  lint_output=$(python -m pylint core_utils)
-
-  python config/stage_1_style_tests/lint_level.py \
-    --lint-output "${lint_output}" \
-    --target-score "10"
+  python -m pylint core_utils | \
+    python config/stage_1_style_tests/lint_level.py \
+      --target-score "10"
 
   check_if_failed
 fi
@@ -46,11 +42,9 @@ for LAB_NAME in $LABS; do
     IGNORE_OPTION="--ignore ${LAB_NAME}/tests"
   fi
 
-  lint_output=$(python -m pylint --exit-zero ${LAB_NAME} ${IGNORE_OPTION})
-
-  python config/stage_1_style_tests/lint_level.py \
-    --lint-output "${lint_output}" \
-    --target-score "${TARGET_SCORE}"
+  python -m pylint --exit-zero ${LAB_NAME} ${IGNORE_OPTION} | \
+    python config/stage_1_style_tests/lint_level.py \
+      --target-score "${TARGET_SCORE}"
 
   check_if_failed
 done
@@ -2,15 +2,50 @@
 Check lint for code style in Python code.
 """
 # pylint: disable=duplicate-code
+import os
 import subprocess
-from os import listdir
+from io import StringIO
 from pathlib import Path
 
-from config.cli_unifier import _run_console_tool, choose_python_exe
+from pylint.lint import Run
+from pylint.reporters.text import TextReporter
+
 from config.constants import PROJECT_CONFIG_PATH, PROJECT_ROOT
 from config.lab_settings import LabSettings
 from config.project_config import ProjectConfig
 from config.stage_1_style_tests.common import check_result
+from config.stage_1_style_tests.lint_level import is_passed, transform_score_into_lint
+
+_LABS_SETTINGS_CACHE: dict[tuple[str, ...], dict[str, Path]] = {}
+
+
+def find_labs_settings(labs_paths: list[Path]) -> dict[str, Path]:
+    """
+    Find settings files of the labs with a single scan of the project root.
+
+    Args:
+        labs_paths (list[Path]): Paths to the labs.
+
+    Returns:
+        dict[str, Path]: Paths to settings files by lab name
+    """
+    labs_names = tuple(lab_path.name for lab_path in labs_paths)
+    if labs_names in _LABS_SETTINGS_CACHE:
+        return _LABS_SETTINGS_CACHE[labs_names]
+
+    with os.scandir(PROJECT_ROOT) as entries:
+        labs_dirs = {entry.name: Path(entry.path) for entry in entries
+                     if entry.name in labs_names and entry.is_dir(follow_symlinks=False)}
+
+    labs_settings = {}
+    for lab_name in labs_names:
+        if lab_name not in labs_dirs:
+            continue
+        settings_path = labs_dirs[lab_name] / "settings.json"
+        if settings_path.is_file():
+            labs_settings[lab_name] = settings_path
+    _LABS_SETTINGS_CACHE[labs_names] = labs_settings
+    return labs_settings
 
 
 def check_lint_on_paths(paths: list[Path], path_to_config: Path,
@@ -27,19 +62,21 @@ def check_lint_on_paths(paths: list[Path], path_to_config: Path,
         subprocess.CompletedProcess: Program execution values
     """
     lint_args = [
-        "-m",
-        "pylint",
-        *map(str, paths)
-        ,
+        *map(str, paths),
         "--rcfile",
-        str(path_to_config)
+        str(path_to_config),
+        "--jobs=0"
     ]
-    if exit_zero:
-        lint_args.append("--exit-zero")
-    return _run_console_tool(str(choose_python_exe()), lint_args, debug=True)
+    lint_output = StringIO()
+    result = Run(lint_args, reporter=TextReporter(lint_output), exit=False)
+    return subprocess.CompletedProcess(
+        args=lint_args,
+        returncode=0 if exit_zero else result.linter.msg_status,
+        stdout=lint_output.getvalue().encode("utf-8")
+    )
 
 
-def check_lint_level(lint_output: bytes, target_score: int) -> subprocess.CompletedProcess:
+def check_lint_level(lint_output: bytes, target_score: int) -> int:
     """
     Run lint level check for the project.
 
@@ -48,17 +85,13 @@ def check_lint_level(lint_output: bytes, target_score: int) -> subprocess.Comple
         target_score (int): Target score.
 
     Returns:
-        subprocess.CompletedProcess: Program execution values
+        int: Lint check passed or not
     """
-    lint_level_args = [
-        "-m",
-        "config.stage_1_style_tests.lint_level",
-        "--lint-output",
-        str(lint_output),
-        "--target-score",
-        str(target_score)
-    ]
-    return _run_console_tool(str(choose_python_exe()), lint_level_args, debug=True)
+    target_lint_level = transform_score_into_lint(target_score)
+    if not target_lint_level:
+        print("\nInvalid value for target score: accepted are 4, 6, 8, 10.\n")
+        return 1
+    return is_passed(lint_output.decode("utf-8"), target_lint_level)
 
 
 def main() -> None:
@@ -70,47 +103,26 @@ def main() -> None:
 
     pyproject_path = PROJECT_ROOT / "pyproject.toml"
 
-    print("Running lint on config, seminars, admin_utils")
-    completed_process = check_lint_on_paths(
-        [
-            PROJECT_ROOT / "config",
-            PROJECT_ROOT / "seminars",
-            PROJECT_ROOT / "admin_utils"
-        ],
-        pyproject_path, True)
-    completed_process = check_lint_level(completed_process.stdout, 10)
-    print(completed_process.stdout.decode("utf-8"))
-    print(completed_process.stderr.decode("utf-8"))
-    check_result(completed_process.returncode)
+    common_paths = [
+        PROJECT_ROOT / "config",
+        PROJECT_ROOT / "seminars",
+        PROJECT_ROOT / "admin_utils"
+    ]
 
     if (PROJECT_ROOT / "core_utils").exists():
         print("core_utils exist")
-        print("Running lint on core_utils")
-        completed_process = check_lint_on_paths(
-            [
-                PROJECT_ROOT / "core_utils"
-            ],
-            pyproject_path)
-        completed_process = check_lint_level(completed_process.stdout, 10)
-        print(completed_process.stdout.decode("utf-8"))
-        print(completed_process.stderr.decode("utf-8"))
-        check_result(completed_process.returncode)
-
-    for lab_name in labs_list:
-        lab_path = PROJECT_ROOT / lab_name
-        if "settings.json" in listdir(lab_path):
-            target_score = LabSettings(PROJECT_ROOT / f"{lab_path}/settings.json").target_score
-
-            print(f"Running lint for lab {lab_path}")
-            completed_process = check_lint_on_paths(
-                        [
-                            lab_path
-                        ],
-                        pyproject_path)
-            completed_process = check_lint_level(completed_process.stdout, target_score)
-            print(completed_process.stdout.decode("utf-8"))
-            print(completed_process.stderr.decode("utf-8"))
-            check_result(completed_process.returncode)
+        common_paths.append(PROJECT_ROOT / "core_utils")
+
+    print(f"Running lint on {', '.join(path.name for path in common_paths)}")
+    completed_process = check_lint_on_paths(common_paths, pyproject_path, True)
+    check_result(check_lint_level(completed_process.stdout, 10))
+
+    for lab_name, settings_path in find_labs_settings(labs_list).items():
+        target_score = LabSettings(settings_path).target_score
+
+        print(f"Running lint for lab {lab_name}")
+        completed_process = check_lint_on_paths([settings_path.parent], pyproject_path, True)
+        check_result(check_lint_level(completed_process.stdout, target_score))
 
 
 if __name__ == "__main__":
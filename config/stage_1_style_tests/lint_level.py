@@ -61,7 +61,8 @@ def is_passed(lint_output: str, target_lint_level: int) -> int:
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Processes lint output and determines whether lint level is passed')
-    parser.add_argument('--lint-output', type=str, help='Output from pylint command')
+    parser.add_argument('--lint-output', type=str,
+                        help='Output from pylint command, read from stdin if omitted')
     parser.add_argument('--target-score', type=str, help='Target score')
     args: argparse.Namespace = parser.parse_args()
 
@@ -72,6 +73,10 @@ if __name__ == '__main__':
         print('\nInvalid value for target score: accepted are 4, 6, 8, 10.\n')
         exit_code = 1
     else:
-        exit_code = is_passed(args.lint_output, target_lint_level)
+        if args.lint_output is not None:
+            lint_output = args.lint_output
+        else:
+            lint_output = sys.stdin.buffer.read().decode('utf-8', errors='replace')
+        exit_code = is_passed(lint_output, target_lint_level)
     print(f'Exit code: {exit_code}')
     sys.exit(exit_code)
@@ -6,6 +6,8 @@ import pathlib
 from pathlib import Path
 from typing import Optional, Union
 
+import orjson
+
 from core_utils.article.article import (Article, ArtifactType, date_from_meta,
                                         get_article_id_from_filepath)
 
@@ -64,12 +66,8 @@ def to_meta(article: Article) -> None:
     Args:
         article (Article): Article instance
     """
-    with open(article.get_meta_file_path(), 'w', encoding='utf-8') as meta_file:
-        json.dump(article.get_meta(),
-                  meta_file,
-                  indent=4,
-                  ensure_ascii=False,
-                  separators=(',', ': '))
+    article.get_meta_file_path().write_bytes(
+        orjson.dumps(article.get_meta(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
 
 def from_meta(path: Union[pathlib.Path, str],
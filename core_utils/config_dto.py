@@ -8,6 +8,9 @@ class ConfigDTO:
     """
     Type annotations for configurations.
     """
+    __slots__ = ('seed_urls', 'total_articles', 'headers', 'encoding', 'timeout',
+                 'should_verify_certificate', 'headless_mode')
+
     #: List of seed urls
     seed_urls: list[str]
 
@@ -41,3 +41,17 @@ class ConfigDTOTest(unittest.TestCase):
                           "should_verify_certificate",
                           "headless_mode"):
             self.assertTrue(hasattr(configuration, attribute))
+
+    @pytest.mark.core_utils
+    def test_config_dto_has_no_instance_dict(self) -> None:
+        """
+        Assert attributes are stored in slots.
+        """
+        configuration = ConfigDTO(seed_urls=["https://github.com"],
+                                  total_articles_to_find_and_parse=2,
+                                  headers={},
+                                  encoding="utf-8",
+                                  timeout=0,
+                                  should_verify_certificate=False,
+                                  headless_mode=False)
+        self.assertFalse(hasattr(configuration, "__dict__"))
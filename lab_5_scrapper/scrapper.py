@@ -3,21 +3,57 @@ Crawler implementation.
 """
 # pylint: disable=too-many-arguments, too-many-instance-attributes, unused-import, undefined-variable
 import datetime
-import json
 import pathlib
+import re
 import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from random import randrange
 from typing import Pattern, Union
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from selectolax.parser import HTMLParser as SelectolaxParser
 
 from core_utils.article import io
 from core_utils.article.article import Article
 from core_utils.config_dto import ConfigDTO
-from core_utils.constants import (ASSETS_PATH, CRAWLER_CONFIG_PATH, TIMEOUT_LOWER_LIMIT,
-                                  TIMEOUT_UPPER_LIMIT)
+from core_utils.constants import (ASSETS_PATH, CRAWLER_CONFIG_PATH, NUM_ARTICLES_UPPER_LIMIT,
+                                  TIMEOUT_LOWER_LIMIT, TIMEOUT_UPPER_LIMIT)
+
+MAX_WORKERS = 8
+
+HTTP_CACHE_PATH = pathlib.Path.home() / '.cache' / 'lab_5_scrapper' / 'http_cache'
+SEED_CACHE_EXPIRATION = 3600
+
+_SESSION_LOCK = threading.Lock()
+
+_SEED_URL_PREFIX = 'https://www.fontanka.ru/'
+_URL_PATTERN = re.compile(r'^/\d{4}/\d{2}/\d{2}/\d+/?$')
+
+_ARTICLE_STRAINER = SoupStrainer('article')
+
+_MONTHS = {
+    'января': 1,
+    'февраля': 2,
+    'марта': 3,
+    'апреля': 4,
+    'мая': 5,
+    'июня': 6,
+    'июля': 7,
+    'августа': 8,
+    'сентября': 9,
+    'октября': 10,
+    'ноября': 11,
+    'декабря': 12
+}
+_DATE_PATTERN = re.compile(r'(\d{1,2})\s+(' + '|'.join(_MONTHS)
+                           + r')\s+(\d{4}),\s*(\d{1,2}):(\d{2})')
 
 
 class IncorrectSeedURLError(Exception):
@@ -92,31 +128,35 @@ class Config:
         Returns:
             ConfigDTO: Config values
         """
-        with open(self.path_to_config, 'r', encoding='utf-8') as config_file:
-            config = json.load(config_file)
+        config = orjson.loads(self.path_to_config.read_bytes())
         return ConfigDTO(**config)
 
     def _validate_config_content(self) -> None:
         """
         Ensure configuration parameters are not corrupt.
         """
-        if not (isinstance(self._seed_urls, list)
-                and all(isinstance(seed, str)
-                        and seed.startswith('https://www.fontanka.ru/')
-                        for seed in self._seed_urls)):
+        seed_urls = self._seed_urls
+        if not (isinstance(seed_urls, list)
+                and all(isinstance(seed, str) and seed.startswith(_SEED_URL_PREFIX)
+                        for seed in seed_urls)):
             raise IncorrectSeedURLError
-        if not isinstance(self._num_articles, int) or self._num_articles < 1:
+
+        num_articles = self._num_articles
+        if not isinstance(num_articles, int) or num_articles < 1:
             raise IncorrectNumberOfArticlesError
-        if self._num_articles > 150:
+        if num_articles > NUM_ARTICLES_UPPER_LIMIT:
             raise NumberOfArticlesOutOfRangeError
+
         if not isinstance(self._headers, dict):
             raise IncorrectHeadersError
         if not isinstance(self._encoding, str):
             raise IncorrectEncodingError
-        if (not isinstance(self._timeout, int)
-                or self._timeout < TIMEOUT_LOWER_LIMIT
-                or self._timeout > TIMEOUT_UPPER_LIMIT):
+
+        timeout = self._timeout
+        if (not isinstance(timeout, int)
+                or not TIMEOUT_LOWER_LIMIT <= timeout <= TIMEOUT_UPPER_LIMIT):
             raise IncorrectTimeoutError
+
         if not isinstance(self._headless_mode, bool):
             raise IncorrectVerifyError
         if not isinstance(self._should_verify_certificate, bool):
@@ -186,6 +226,50 @@ class Config:
         return self._headless_mode
 
 
+@lru_cache(maxsize=1)
+def _create_session() -> requests_cache.CachedSession:
+    """
+    Create the shared caching session.
+
+    Returns:
+        requests_cache.CachedSession: Session with on-disk cache and pooled connections
+    """
+    session = requests_cache.CachedSession(HTTP_CACHE_PATH, backend='sqlite',
+                                           cache_control=True)
+    session.mount('https://', HTTPAdapter(pool_connections=MAX_WORKERS,
+                                          pool_maxsize=MAX_WORKERS,
+                                          max_retries=0))
+    return session
+
+
+def _get_session() -> requests_cache.CachedSession:
+    """
+    Retrieve the shared caching session, creating it on first use.
+
+    Returns:
+        requests_cache.CachedSession: Session with on-disk cache and pooled connections
+    """
+    with _SESSION_LOCK:
+        return _create_session()
+
+
+def _is_cached(session: requests_cache.CachedSession, url: str, verify: bool) -> bool:
+    """
+    Check whether a fresh response for url is stored in the cache.
+
+    Args:
+        session (requests_cache.CachedSession): Caching session
+        url (str): Site url
+        verify (bool): Whether to verify certificate
+
+    Returns:
+        bool: Whether the response can be served without a network call
+    """
+    key = session.cache.create_key(requests.Request('GET', url).prepare(), verify=verify)
+    cached = session.cache.get_response(key)
+    return cached is not None and not cached.is_expired
+
+
 def make_request(url: str, config: Config) -> requests.models.Response:
     """
     Deliver a response from a request with given configuration.
@@ -200,8 +284,16 @@ def make_request(url: str, config: Config) -> requests.models.Response:
     verify = config.get_verify_certificate()
     headers = config.get_headers()
     timeout = config.get_timeout()
-    time.sleep(randrange(1, 5))
-    return requests.get(url=url, verify=verify, headers=headers, timeout=timeout)
+    session = _get_session()
+    if url in config.get_seed_urls():
+        expire_after = SEED_CACHE_EXPIRATION
+        if not _is_cached(session, url, verify):
+            time.sleep(randrange(1, 5))
+    else:
+        expire_after = requests_cache.EXPIRE_IMMEDIATELY
+        time.sleep(randrange(1, 5))
+    return session.get(url=url, verify=verify, headers=headers, timeout=timeout,
+                       expire_after=expire_after)
 
 
 class Crawler:
@@ -220,42 +312,58 @@ class Crawler:
         """
         self.config = config
         self.urls = []
+        self.url_pattern = _URL_PATTERN
 
-    def _extract_url(self, article_bs: BeautifulSoup) -> str:
+    def _extract_url(self, seed_html: SelectolaxParser) -> str:
         """
         Find and retrieve url from HTML.
 
         Args:
-            article_bs (bs4.BeautifulSoup): BeautifulSoup instance
+            seed_html (selectolax.parser.HTMLParser): Parsed HTML of the seed page
 
         Returns:
             str: Url from HTML
         """
-        section = article_bs.find_all('section')[1]
-        articles = section.select('a[href^="/2024/"]')
+        section = seed_html.css('section')[1]
         url = ''
-        for article in articles:
-            url = 'https://www.fontanka.ru' + article.get('href')
-            if 'all.comments' in url or 'erid' in url:
+        for article in section.css('a[href]'):
+            href = article.attributes.get('href')
+            if not href or not self.url_pattern.search(href):
                 continue
+            url = 'https://www.fontanka.ru' + href
             if url not in self.urls:
                 break
         return url
 
+    def _get_seed_html(self, seed: str) -> Union[SelectolaxParser, None]:
+        """
+        Request seed page and parse its HTML.
+
+        Args:
+            seed (str): Seed url
+
+        Returns:
+            Union[selectolax.parser.HTMLParser, None]: Parsed HTML or None if request failed
+        """
+        response = make_request(seed, self.config)
+        if not response.ok:
+            return None
+        return SelectolaxParser(response.content)
+
     def find_articles(self) -> None:
         """
         Find articles.
         """
         num = self.config.get_num_articles()
-        for seed in self.get_search_urls():
-            response = make_request(seed, self.config)
-            if not response.ok:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            pages = list(executor.map(self._get_seed_html, self.get_search_urls()))
+        for page in pages:
+            if page is None:
                 continue
-            soup = BeautifulSoup(response.text, 'lxml')
-            url = self._extract_url(soup)
+            url = self._extract_url(page)
             while url and len(self.urls) < num:
                 self.urls.append(url)
-                url = self._extract_url(soup)
+                url = self._extract_url(page)
 
     def get_search_urls(self) -> list:
         """
@@ -332,22 +440,11 @@ class HTMLParser:
         Returns:
             datetime.datetime: Datetime object
         """
-        date = date_str.split()
-        month = {'января': '01',
-                 'февраля': '02',
-                 'марта': '03',
-                 'апреля': '04',
-                 'мая': '05',
-                 'июня': '06',
-                 'июля': '07',
-                 'августа': '08',
-                 'сентября': '09',
-                 'октября': '10',
-                 'ноября': '11',
-                 'декабря': '12'
-                 }
-        date[1] = month[date[1]]
-        return datetime.datetime.strptime(' '.join(date), '%d %m %Y, %H:%M')
+        match = _DATE_PATTERN.fullmatch(date_str.strip())
+        if match is None:
+            raise ValueError(f'Unsupported date format: {date_str!r}')
+        day, month, year, hour, minute = match.groups()
+        return datetime.datetime(int(year), _MONTHS[month], int(day), int(hour), int(minute))
 
     def parse(self) -> Union[Article, bool, list]:
         """
@@ -359,7 +456,7 @@ class HTMLParser:
         response = make_request(url=self.full_url, config=self.config)
         if not response.ok:
             return False
-        soup = BeautifulSoup(response.text, features="lxml")
+        soup = BeautifulSoup(response.content, features="lxml", parse_only=_ARTICLE_STRAINER)
         self._fill_article_with_text(soup)
         self._fill_article_with_meta_information(soup)
         return self.article
@@ -372,6 +469,7 @@ def prepare_environment(base_path: Union[pathlib.Path, str]) -> None:
     Args:
         base_path (Union[pathlib.Path, str]): Path where articles stores
     """
+    base_path = pathlib.Path(base_path)
     if base_path.exists():
         shutil.rmtree(base_path)
     base_path.mkdir(parents=True)
@@ -386,14 +484,16 @@ def main() -> None:
     prepare_environment(ASSETS_PATH)
 
     crawler.find_articles()
+    parsers = [HTMLParser(full_url=url, article_id=i, config=config)
+               for i, url in enumerate(crawler.urls, start=1)]
     i = 1
-    for url in crawler.urls:
-        parser = HTMLParser(full_url=url, article_id=i, config=config)
-        article = parser.parse()
-        if isinstance(article, Article):
-            io.to_raw(article)
-            io.to_meta(article)
-            i += 1
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for article in executor.map(HTMLParser.parse, parsers):
+            if isinstance(article, Article):
+                article.article_id = i
+                io.to_raw(article)
+                io.to_meta(article)
+                i += 1
 
 
 if __name__ == "__main__":